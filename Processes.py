@@ -10,8 +10,14 @@ so formulas using mass (kg) work consistently.
 """
 from __future__ import annotations
 
-from math import log, pow
-from typing import Dict, List, Literal, TypedDict, Optional
+from functools import lru_cache
+from math import log
+from types import MappingProxyType
+from typing import Dict, List, Literal, Mapping, NamedTuple, Tuple, TypedDict, Optional
+
+import numpy as np
+
+from _kernels import JIT_ENABLED, make_process_kernel, pv_power_curve
 
 ProcessType = Literal["constantVolume", "constantPressure", "isothermal", "adiabatic", "polytropic"]
 
@@ -26,6 +32,16 @@ class ProcessInput(TypedDict, total=False):
     n: Optional[float]
 
 
+class PVData(TypedDict):
+    P: List[float]  # kPa
+    V: List[float]  # m^3
+
+
+class TSData(TypedDict):
+    T: List[float]  # K
+    S: List[float]  # kJ/K
+
+
 class ProcessResult(TypedDict):
     P1: float
     V1: float
@@ -37,16 +53,17 @@ class ProcessResult(TypedDict):
     Q: float
     deltaU: float
     deltaS: float
-    pvData: List[Dict[str, float]]
-    tsData: List[Dict[str, float]]
+    pvData: PVData
+    tsData: TSData
 
 
 # Universal gas constant (J/(mol·K))
 R_UNIVERSAL = 8.314462618
 
 # Gas properties. M is given in g/mol for readability; R, Cv, Cp are stored as
-# specific values in J/(kg·K) where possible.
-GAS_PROPERTIES: Dict[str, Dict[str, float]] = {
+# specific values in J/(kg·K) where possible. Converted below, then exposed
+# read-only as GAS_PROPERTIES.
+_RAW_GAS_PROPERTIES: Dict[str, Dict[str, float]] = {
     "idealGas": {
         "name": "Ideal Gas (air-like)",
         "M": 28.97,  # g/mol (approx air)
@@ -73,9 +90,9 @@ GAS_PROPERTIES: Dict[str, Dict[str, float]] = {
 }
 
 
-def _ensure_specific_properties():
+def _ensure_specific_properties(gas_properties: Dict[str, Dict[str, float]]) -> None:
     """Populate/convert per-kg properties for entries that currently have molar values."""
-    for key, props in GAS_PROPERTIES.items():
+    for key, props in gas_properties.items():
         M_g = props.get("M")
         if M_g is None:
             continue
@@ -93,7 +110,46 @@ def _ensure_specific_properties():
             props["gamma"] = props["Cp"] / props["Cv"]
 
 
-_ensure_specific_properties()
+_ensure_specific_properties(_RAW_GAS_PROPERTIES)
+
+# Freeze copies after conversion, then drop the raw dict, so nothing can re-run
+# or undo the conversion (e.g. dividing Cv by M twice).
+GAS_PROPERTIES: Mapping[str, Mapping[str, float]] = MappingProxyType(
+    {key: MappingProxyType(dict(props)) for key, props in _RAW_GAS_PROPERTIES.items()}
+)
+del _RAW_GAS_PROPERTIES
+
+
+class GasProps(NamedTuple):
+    """Resolved per-kg properties of a substance (J/(kg·K))."""
+
+    R: float
+    Cv: float
+    Cp: float
+    gamma: float
+    name: str
+
+
+def _build_gas_table() -> Dict[str, GasProps]:
+    """Resolve GAS_PROPERTIES into GasProps once, failing fast on incomplete entries."""
+    table: Dict[str, GasProps] = {}
+    for key, props in GAS_PROPERTIES.items():
+        Cv = props.get("Cv")
+        Cp = props.get("Cp")
+        R = props.get("R")
+        if Cv is None or Cp is None or R is None:
+            raise ValueError(f"Gas properties incomplete for '{key}': need Cv, Cp and R")
+        if props.get("gamma"):
+            gamma = float(props["gamma"])
+        else:
+            if Cv == 0:
+                raise ValueError(f"Invalid gas property for '{key}': Cv must be non-zero to compute gamma")
+            gamma = float(Cp) / float(Cv)
+        table[key] = GasProps(R=float(R), Cv=float(Cv), Cp=float(Cp), gamma=gamma, name=props.get("name", key))
+    return table
+
+
+_GAS_TABLE: Dict[str, GasProps] = _build_gas_table()
 
 
 PROCESS_NAMES: Dict[ProcessType, str] = {
@@ -114,17 +170,21 @@ PROCESS_EQUATIONS: Dict[ProcessType, str] = {
 }
 
 
-def _validate_input(input_data: ProcessInput) -> None:
-    for name in ("P1", "V1", "T1"):
-        if name not in input_data or input_data[name] is None:
-            raise ValueError(f"Missing required input: {name}")
-        if input_data[name] <= 0:
-            raise ValueError(f"{name} must be positive")
-    # Optional provided values must also be positive if present
-    for opt in ("P2", "V2", "T2"):
-        if opt in input_data and input_data[opt] is not None:
-            if input_data[opt] <= 0:
-                raise ValueError(f"{opt} must be positive if provided")
+# One kernel per (process type, substance) with that gas's constants baked in.
+_KERNEL_TABLE = {
+    (process_type, substance): make_process_kernel(process_type, gp.Cv, gp.Cp, gp.R, gp.gamma)
+    for process_type in PROCESS_NAMES
+    for substance, gp in _GAS_TABLE.items()
+}
+
+
+def warm_kernels() -> None:
+    """Compile every kernel with representative float arguments (no-op without JIT)."""
+    if not JIT_ENABLED:
+        return
+    for (process_type, _), kernel in _KERNEL_TABLE.items():
+        X2 = 450.0 if process_type in ("constantVolume", "constantPressure") else 2.0
+        kernel(100.0, 1.0, 300.0, X2, 1.3, 1.0)
 
 
 def calculate_process(process_type: ProcessType, substance: str, input_data: ProcessInput, mass: float = 1.0) -> ProcessResult:
@@ -133,115 +193,42 @@ def calculate_process(process_type: ProcessType, substance: str, input_data: Pro
     Notes:
     - P in kPa, V in m^3, T in K
     - Energies in kJ (P [kPa] * V [m^3] = kJ)
+    - Invalid inputs raise ValueError. The API rejects them earlier through
+      its Pydantic request model; these checks keep direct callers safe.
     """
-    _validate_input(input_data)
     if mass <= 0:
         raise ValueError("mass must be positive (kg)")
 
-    gas = GAS_PROPERTIES.get(substance)
-    if gas is None:
+    gp = _GAS_TABLE.get(substance)
+    if gp is None:
         raise ValueError(f"Unknown substance: {substance}")
 
-    P1 = input_data["P1"]
-    V1 = input_data["V1"]
-    T1 = input_data["T1"]
+    P1 = input_data.get("P1")
+    V1 = input_data.get("V1")
+    T1 = input_data.get("T1")
+    for name, value in (("P1", P1), ("V1", V1), ("T1", T1)):
+        if value is None:
+            raise ValueError(f"Missing required input: {name}")
+        if value <= 0:
+            raise ValueError(f"{name} must be positive")
     n = input_data.get("n", 1.3)
 
-    P2 = V2 = T2 = 0.0
-    W = Q = deltaU = deltaS = 0.0
-
-    # Shortcuts to gas props (validate presence)
-    Cv = gas.get("Cv")
-    Cp = gas.get("Cp")
-    R = gas.get("R")
-    if Cv is None or Cp is None or R is None:
-        raise ValueError(f"Gas properties incomplete for '{substance}': need Cv, Cp and R")
-    # compute gamma safely
-    if "gamma" in gas and gas.get("gamma"):
-        gamma = float(gas.get("gamma"))
-    else:
-        if Cv == 0:
-            raise ValueError("Invalid gas property: Cv must be non-zero to compute gamma")
-        gamma = float(Cp) / float(Cv)
+    kernel = _KERNEL_TABLE.get((process_type, substance))
+    if kernel is None:
+        raise ValueError(f"Unknown process type: {process_type}")
 
-    if process_type == "constantVolume":
-        V2 = V1
-        T2 = input_data.get("T2", T1 * 1.5)
-        if T2 <= 0:
+    if process_type in ("constantVolume", "constantPressure"):
+        X2 = input_data.get("T2", T1 * 1.5)
+        if X2 <= 0:
             raise ValueError("Computed T2 must be positive")
-        P2 = P1 * (T2 / T1)
-        W = 0.0
-        deltaU = mass * Cv * (T2 - T1) / 1000.0
-        Q = deltaU
-        deltaS = mass * Cv * log(T2 / T1) / 1000.0
-
-    elif process_type == "constantPressure":
-        P2 = P1
-        T2 = input_data.get("T2", T1 * 1.5)
-        if T2 <= 0:
-            raise ValueError("Computed T2 must be positive")
-        V2 = V1 * (T2 / T1)
-        W = P1 * (V2 - V1)  # kJ (kPa·m^3)
-        deltaU = mass * Cv * (T2 - T1) / 1000.0
-        Q = mass * Cp * (T2 - T1) / 1000.0
-        deltaS = mass * Cp * log(T2 / T1) / 1000.0
-
-    elif process_type == "isothermal":
-        T2 = T1
-        V2 = input_data.get("V2", V1 * 2.0)
-        if V2 <= 0:
-            raise ValueError("V2 must be positive for isothermal process")
-        P2 = P1 * V1 / V2
-        # Work for isothermal ideal gas: W = P1 V1 ln(V2/V1)
-        if V2 / V1 <= 0:
-            raise ValueError("Volume ratio must be positive for log calculation")
-        W = P1 * V1 * log(V2 / V1)
-        deltaU = 0.0
-        Q = W
-        deltaS = mass * R * log(V2 / V1) / 1000.0
-
-    elif process_type == "adiabatic":
-        V2 = input_data.get("V2", V1 * 2.0)
-        if V2 <= 0:
-            raise ValueError("V2 must be positive for adiabatic process")
-        P2 = P1 * pow(V1 / V2, gamma)
-        T2 = T1 * pow(V1 / V2, gamma - 1.0)
-        Q = 0.0
-        deltaU = mass * Cv * (T2 - T1) / 1000.0
-        # For an adiabatic closed process: W = -ΔU
-        W = -deltaU
-        deltaS = 0.0
-
-    elif process_type == "polytropic":
-        V2 = input_data.get("V2", V1 * 2.0)
-        if V2 <= 0:
-            raise ValueError("V2 must be positive for polytropic process")
-        # If n == 1, polytropic -> isothermal. Use isothermal formulas.
-        if abs(n - 1.0) < 1e-9:
-            # isothermal limit
-            T2 = T1
-            P2 = P1 * V1 / V2
-            if V2 / V1 <= 0:
-                raise ValueError("Volume ratio must be positive for log calculation")
-            W = P1 * V1 * log(V2 / V1)
-            deltaU = 0.0
-            Q = W
-            deltaS = mass * R * log(V2 / V1) / 1000.0
-        else:
-            P2 = P1 * pow(V1 / V2, n)
-            T2 = T1 * pow(V1 / V2, n - 1.0)
-            W = (P2 * V2 - P1 * V1) / (1.0 - n)
-            deltaU = mass * Cv * (T2 - T1) / 1000.0
-            Q = deltaU + W
-            # entropy change: ΔS = m*Cv*ln(T2/T1) + m*R*ln(V2/V1)
-            if T2 / T1 <= 0 or V2 / V1 <= 0:
-                raise ValueError("Temperature and volume ratios must be positive for log calculation")
-            deltaS = (mass * Cv * log(T2 / T1) + mass * R * log(V2 / V1)) / 1000.0
-
     else:
-        raise ValueError(f"Unknown process type: {process_type}")
+        X2 = input_data.get("V2", V1 * 2.0)
+        if X2 <= 0:
+            raise ValueError(f"V2 must be positive for {process_type} process")
+
+    P2, V2, T2, W, Q, deltaU, deltaS = kernel(P1, V1, T1, X2, n, mass)
 
-    pv_data = generate_pv_data(process_type, P1, V1, P2, V2, gamma, n)
+    pv_data = generate_pv_data(process_type, P1, V1, P2, V2, gp.gamma, n)
     ts_data = generate_ts_data(process_type, T1, T2, deltaS, substance, mass)
 
     result: ProcessResult = {
@@ -262,81 +249,100 @@ def calculate_process(process_type: ProcessType, substance: str, input_data: Pro
     return result
 
 
-def generate_pv_data(process_type: ProcessType, P1: float, V1: float, P2: float, V2: float, gamma: float, n: float) -> List[Dict[str, float]]:
-    points: List[Dict[str, float]] = []
-    num_points = 50
+# Below this many points the NumPy path beats spinning up Numba's thread pool.
+PARALLEL_MIN_POINTS = 10_000
+
+
+def generate_pv_data(process_type: ProcessType, P1: float, V1: float, P2: float, V2: float, gamma: float, n: float, num_points: int = 50) -> PVData:
+    # Straight lines on the P-V diagram: the two end states are enough
+    if process_type == "constantVolume":
+        return {"P": [P1, P2], "V": [V1, V1]}
+    if process_type == "constantPressure":
+        return {"P": [P1, P1], "V": [V1, V2]}
+    # Degenerate path: no volume change, so every sample is the same state
+    if V2 == V1:
+        return {"P": [P1, P2], "V": [V1, V2]}
+
+    P, V = _pv_columns(process_type, P1, V1, V2, gamma, n, num_points)
+    return {"P": list(P), "V": list(V)}
+
+
+@lru_cache(maxsize=1024)
+def _pv_columns(process_type: ProcessType, P1: float, V1: float, V2: float, gamma: float, n: float, num_points: int) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Memoized (P, V) samples; tuples so cached values cannot be mutated."""
     Vmin = min(V1, V2)
     Vmax = max(V1, V2)
 
-    for i in range(num_points + 1):
-        t = i / num_points
-        if process_type == "constantVolume":
-            V = V1
-            P = P1 + t * (P2 - P1)
-        elif process_type == "constantPressure":
-            V = Vmin + t * (Vmax - Vmin)
-            P = P1
-        elif process_type == "isothermal":
-            V = Vmin + t * (Vmax - Vmin)
+    if JIT_ENABLED and num_points >= PARALLEL_MIN_POINTS and process_type in ("isothermal", "adiabatic", "polytropic"):
+        # Large grids: sample P = P1 * (V1/V)**k across threads
+        exponent = {"isothermal": 1.0, "adiabatic": gamma, "polytropic": n}[process_type]
+        V = np.empty(num_points + 1)
+        P = np.empty(num_points + 1)
+        pv_power_curve(P1, V1, Vmin, Vmax, exponent, V, P)
+    else:
+        V = np.linspace(Vmin, Vmax, num_points + 1)
+        if process_type == "isothermal":
             P = P1 * V1 / V
         elif process_type == "adiabatic":
-            V = Vmin + t * (Vmax - Vmin)
-            P = P1 * pow(V1 / V, gamma)
+            P = P1 * (V1 / V) ** gamma
         elif process_type == "polytropic":
-            V = Vmin + t * (Vmax - Vmin)
-            P = P1 * pow(V1 / V, n)
+            P = P1 * (V1 / V) ** n
         else:
-            V = Vmin + t * (Vmax - Vmin)
-            P = P1
-        points.append({"P": P, "V": V})
+            # any other process: flat line at P1
+            P = np.full(num_points + 1, P1)
 
-    return points
+    return tuple(P.tolist()), tuple(V.tolist())
 
 
-def generate_ts_data(process_type: ProcessType, T1: float, T2: float, deltaS: float, substance: str, mass: float) -> List[Dict[str, float]]:
-    points: List[Dict[str, float]] = []
-    num_points = 50
-    gas = GAS_PROPERTIES.get(substance)
-    if gas is None:
+def generate_ts_data(process_type: ProcessType, T1: float, T2: float, deltaS: float, substance: str, mass: float) -> TSData:
+    if substance not in _GAS_TABLE:
         raise ValueError(f"Unknown substance for TS generation: {substance}")
-    Cv = gas.get("Cv")
-    Cp = gas.get("Cp")
+
+    # Straight lines on the T-S diagram: the two end states are enough
+    if process_type == "isothermal":
+        return {"T": [T1, T1], "S": [0.0, deltaS]}
+    if process_type == "adiabatic":
+        return {"T": [T1, T2], "S": [0.0, 0.0]}
+    if process_type == "polytropic":
+        # Drawn as linear in both T and S between the end states
+        return {"T": [T1, T2], "S": [0.0, deltaS]}
+    # Degenerate path: no temperature change, so every sample is the same state
+    if T2 == T1:
+        return {"T": [T1, T2], "S": [0.0, deltaS]}
+
+    T, S = _ts_columns(process_type, T1, T2, deltaS, substance, mass)
+    return {"T": list(T), "S": list(S)}
+
+
+@lru_cache(maxsize=1024)
+def _ts_columns(process_type: ProcessType, T1: float, T2: float, deltaS: float, substance: str, mass: float) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+    """Memoized (T, S) samples; tuples so cached values cannot be mutated."""
+    num_points = 50
+    gp = _GAS_TABLE[substance]
     S1 = 0.0
 
-    for i in range(num_points + 1):
-        t = i / num_points
-        if process_type == "constantVolume":
-            T = T1 + t * (T2 - T1)
-            if T / T1 <= 0:
-                raise ValueError("Temperature ratio must be positive for entropy log calculation")
-            S = S1 + mass * Cv * log(T / T1) / 1000.0
-        elif process_type == "constantPressure":
-            T = T1 + t * (T2 - T1)
-            if T / T1 <= 0:
-                raise ValueError("Temperature ratio must be positive for entropy log calculation")
-            S = S1 + mass * Cp * log(T / T1) / 1000.0
-        elif process_type == "isothermal":
-            T = T1
-            S = S1 + t * deltaS
-        elif process_type == "adiabatic":
-            T = T1 + t * (T2 - T1)
-            S = S1
-        elif process_type == "polytropic":
-            T = T1 + t * (T2 - T1)
-            S = S1 + t * deltaS
-        else:
-            T = T1 + t * (T2 - T1)
-            S = S1 + t * deltaS
-        points.append({"T": T, "S": S})
+    t = np.linspace(0.0, 1.0, num_points + 1)
+    T = T1 + t * (T2 - T1)
+
+    if process_type in ("constantVolume", "constantPressure"):
+        if np.any(T <= 0):
+            raise ValueError("Temperature ratio must be positive for entropy log calculation")
+        C = gp.Cv if process_type == "constantVolume" else gp.Cp
+        S = S1 + mass * C * (np.log(T) - log(T1)) / 1000.0
+    else:
+        # any other process: linear in entropy
+        S = S1 + t * deltaS
 
-    return points
+    return tuple(T.tolist()), tuple(S.tolist())
 
 
 __all__ = [
     "GAS_PROPERTIES",
+    "GasProps",
     "calculate_process",
     "generate_pv_data",
     "generate_ts_data",
+    "warm_kernels",
     "PROCESS_NAMES",
     "PROCESS_EQUATIONS",
 ]
@@ -0,0 +1,132 @@
+"""Compiled numeric kernels for the process calculations.
+
+Each process kernel is a pure function of floats that returns the final state
+and energetics as a tuple ``(P2, V2, T2, W, Q, deltaU, deltaS)`` using the
+same units as Processes.py (kPa, m^3, K, kJ). Input validation stays in
+``calculate_process``; the kernels assume positive, already-checked values.
+
+Numba is optional and only used when ENABLE_JIT=1 is set; otherwise the
+kernels run as plain Python.
+"""
+from __future__ import annotations
+
+import os
+from math import log
+
+# JIT compilation costs hundreds of ms per kernel, which a lightly loaded
+# API never earns back, so it is opt-in via ENABLE_JIT=1.
+JIT_ENABLED = False
+if os.getenv("ENABLE_JIT", "0") == "1":
+    try:
+        from numba import njit, prange
+        JIT_ENABLED = True
+    except ImportError:  # pragma: no cover - numba is an optional speedup
+        pass
+
+if not JIT_ENABLED:
+    prange = range
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def make_process_kernel(process_type: str, Cv: float, Cp: float, R: float, gamma: float):
+    """Build a kernel ``f(P1, V1, T1, X2, n, mass)`` specialised for one process and gas.
+
+    X2 is the given final temperature T2 for constantVolume/constantPressure
+    and the final volume V2 otherwise. The gas constants are closure
+    variables, which Numba freezes as compile-time constants, and the
+    process branch is selected here rather than on every call.
+    """
+    if process_type == "constantVolume":
+        def kernel(P1, V1, T1, X2, n, mass):
+            T2 = X2
+            V2 = V1
+            P2 = P1 * (T2 / T1)
+            W = 0.0
+            deltaU = mass * Cv * (T2 - T1) / 1000.0
+            Q = deltaU
+            deltaS = mass * Cv * log(T2 / T1) / 1000.0
+            return P2, V2, T2, W, Q, deltaU, deltaS
+
+    elif process_type == "constantPressure":
+        def kernel(P1, V1, T1, X2, n, mass):
+            T2 = X2
+            P2 = P1
+            V2 = V1 * (T2 / T1)
+            W = P1 * (V2 - V1)  # kJ (kPa·m^3)
+            deltaU = mass * Cv * (T2 - T1) / 1000.0
+            Q = mass * Cp * (T2 - T1) / 1000.0
+            deltaS = mass * Cp * log(T2 / T1) / 1000.0
+            return P2, V2, T2, W, Q, deltaU, deltaS
+
+    elif process_type == "isothermal":
+        def kernel(P1, V1, T1, X2, n, mass):
+            V2 = X2
+            T2 = T1
+            P2 = P1 * V1 / V2
+            # Work for isothermal ideal gas: W = P1 V1 ln(V2/V1)
+            log_ratio = log(V2 / V1)
+            W = P1 * V1 * log_ratio
+            deltaU = 0.0
+            Q = W
+            deltaS = mass * R * log_ratio / 1000.0
+            return P2, V2, T2, W, Q, deltaU, deltaS
+
+    elif process_type == "adiabatic":
+        def kernel(P1, V1, T1, X2, n, mass):
+            V2 = X2
+            ratio = V1 / V2
+            P2 = P1 * ratio ** gamma
+            T2 = T1 * ratio ** (gamma - 1.0)
+            Q = 0.0
+            deltaU = mass * Cv * (T2 - T1) / 1000.0
+            # For an adiabatic closed process: W = -ΔU
+            W = -deltaU
+            deltaS = 0.0
+            return P2, V2, T2, W, Q, deltaU, deltaS
+
+    elif process_type == "polytropic":
+        def kernel(P1, V1, T1, X2, n, mass):
+            V2 = X2
+            # If n == 1, polytropic -> isothermal. Use isothermal formulas.
+            if abs(n - 1.0) < 1e-9:
+                T2 = T1
+                P2 = P1 * V1 / V2
+                log_ratio = log(V2 / V1)
+                W = P1 * V1 * log_ratio
+                deltaU = 0.0
+                Q = W
+                deltaS = mass * R * log_ratio / 1000.0
+            else:
+                ratio = V1 / V2
+                P2 = P1 * ratio ** n
+                T2 = T1 * ratio ** (n - 1.0)
+                W = (P2 * V2 - P1 * V1) / (1.0 - n)
+                deltaU = mass * Cv * (T2 - T1) / 1000.0
+                Q = deltaU + W
+                # entropy change: ΔS = m*Cv*ln(T2/T1) + m*R*ln(V2/V1)
+                deltaS = (mass * Cv * log(T2 / T1) + mass * R * log(V2 / V1)) / 1000.0
+            return P2, V2, T2, W, Q, deltaU, deltaS
+
+    else:
+        raise ValueError(f"Unknown process type: {process_type}")
+
+    # Closures are not cached to disk: every kernel shares one source location.
+    return njit(kernel)
+
+
+@njit(parallel=True, cache=True)
+def pv_power_curve(P1, V1, Vmin, Vmax, exponent, out_V, out_P):
+    """Fill out_V/out_P with P = P1 * (V1/V)**exponent sampled over [Vmin, Vmax].
+
+    Iterations are independent, so the loop is split across threads. Only
+    worth it for large grids; thread start-up dominates at ~50 points.
+    """
+    num_points = out_V.shape[0] - 1
+    for i in prange(num_points + 1):
+        V = Vmin + (i / num_points) * (Vmax - Vmin)
+        out_V[i] = V
+        out_P[i] = P1 * (V1 / V) ** exponent
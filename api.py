@@ -1,28 +1,90 @@
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Dict, List, Literal, Optional, Tuple
+import asyncio
 import base64
 import io
+import os
+import threading
 
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-from pydantic import BaseModel
-
 import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from pydantic import BaseModel, Field
+
+from Processes import calculate_process, warm_kernels, GAS_PROPERTIES
+
 
-from Processes import calculate_process, GAS_PROPERTIES
+class ProcessInputModel(BaseModel):
+    """Process inputs; positivity is enforced by Pydantic at parse time."""
+
+    P1: float = Field(gt=0)  # kPa
+    V1: float = Field(gt=0)  # m^3
+    T1: float = Field(gt=0)  # K
+    P2: Optional[float] = Field(None, gt=0)
+    V2: Optional[float] = Field(None, gt=0)
+    T2: Optional[float] = Field(None, gt=0)
+    n: Optional[float] = None
 
 
 class ProcessRequest(BaseModel):
     process_type: str
     substance: str
-    input_data: Dict[str, float]
-    mass: float = 1.0
+    input_data: ProcessInputModel
+    mass: float = Field(1.0, gt=0)
+
+
+class PVDataModel(BaseModel):
+    P: List[float]  # kPa
+    V: List[float]  # m^3
+
+
+class TSDataModel(BaseModel):
+    T: List[float]  # K
+    S: List[float]  # kJ/K
+
 
+class ProcessResultModel(BaseModel):
+    P1: float
+    V1: float
+    T1: float
+    P2: float
+    V2: float
+    T2: float
+    W: float
+    Q: float
+    deltaU: float
+    deltaS: float
+    pvData: PVDataModel
+    tsData: TSDataModel
 
-app = FastAPI(title="Thermo Processes API")
+
+class CalculateResponse(BaseModel):
+    """With a response_model FastAPI serializes straight to JSON bytes in pydantic-core."""
+
+    result: ProcessResultModel
+    pv_plot: Optional[str] = None
+    ts_plot: Optional[str] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Compile JIT kernels in the background so start-up is not blocked.
+    # Requests arriving before this finishes still wait on compilation, but
+    # /calculate runs the calculation in the threadpool, so the event loop
+    # keeps serving other connections meanwhile.
+    threading.Thread(target=warm_kernels, name="warm-kernels", daemon=True).start()
+    yield
+
+
+app = FastAPI(title="Thermo Processes API", lifespan=lifespan)
 
 # Enable CORS for development. Restrict allow_origins in production.
 app.add_middleware(
@@ -33,6 +95,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (pvData/tsData columns, ?plot= data URLs).
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Serve static frontend files from ./static at /static
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -43,47 +108,90 @@ def root() -> FileResponse:
     return FileResponse("static/index.html")
 
 
-def _plot_to_base64(fig) -> str:
+# One Figure/Canvas per worker thread, reused across requests (no pyplot state).
+_plot_state = threading.local()
+
+
+def _get_axes():
+    if not hasattr(_plot_state, "canvas"):
+        fig = Figure(tight_layout=True)
+        _plot_state.canvas = FigureCanvasAgg(fig)
+        _plot_state.ax = fig.add_subplot(111)
+    return _plot_state.canvas, _plot_state.ax
+
+
+_PLOT_MIME = {"svg": "image/svg+xml", "png": "image/png"}
+# Emit SVG text as <text> rather than glyph paths: much smaller output.
+matplotlib.rcParams["svg.fonttype"] = "none"
+
+
+def _plot_to_base64(x, y, xlabel: str, ylabel: str, title: str, fmt: str) -> str:
+    canvas, ax = _get_axes()
+    ax.clear()
+    if x:
+        ax.plot(x, y, marker=".")
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel(ylabel)
+        ax.set_title(title)
     buf = io.BytesIO()
-    fig.savefig(buf, format="png", bbox_inches="tight")
-    plt.close(fig)
-    buf.seek(0)
-    data = base64.b64encode(buf.read()).decode("ascii")
-    return f"data:image/png;base64,{data}"
+    # SVG skips the PNG rasterize + deflate step and is much smaller
+    canvas.print_figure(buf, format=fmt)
+    data = base64.b64encode(buf.getvalue()).decode("ascii")
+    return f"data:{_PLOT_MIME[fmt]};base64,{data}"
+
+
+# Plot rendering runs here so it does not block the event loop. Each request
+# renders at most two diagrams, and every uvicorn worker process has its own
+# pool (and one Figure per pool thread), so keep it small.
+PLOT_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def _render_pv(result: Dict[str, Any], fmt: str) -> str:
+    pv = result.get("pvData", {})
+    return _plot_to_base64(pv.get("V", []), pv.get("P", []), "V (m^3)", "P (kPa)", "P-V diagram", fmt)
+
+
+def _render_ts(result: Dict[str, Any], fmt: str) -> str:
+    ts = result.get("tsData", {})
+    return _plot_to_base64(ts.get("S", []), ts.get("T", []), "S (kJ/K)", "T (K)", "T-S diagram", fmt)
+
+
+async def _render_plots(result: Dict[str, Any], fmt: str) -> Dict[str, str]:
+    """Render P-V and T-S diagrams as SVG or PNG data URLs (server-side fallback)."""
+    loop = asyncio.get_running_loop()
+    pv_img, ts_img = await asyncio.gather(
+        loop.run_in_executor(PLOT_POOL, _render_pv, result, fmt),
+        loop.run_in_executor(PLOT_POOL, _render_ts, result, fmt),
+    )
+    return {"pv_plot": pv_img, "ts_plot": ts_img}
+
+
+@lru_cache(maxsize=1024)
+def _cached_calculate(process_type: str, substance: str, items: Tuple[Tuple[str, float], ...], mass: float) -> Dict[str, Any]:
+    """calculate_process is pure, so identical requests share one result.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return calculate_process(process_type, substance, dict(items), mass=mass)
+
 
+@app.post("/calculate", response_model=CalculateResponse, response_model_exclude_none=True)
+async def calculate(req: ProcessRequest, plot: Optional[Literal["svg", "png"]] = None) -> Any:
+    """Return the computed result; pvData/tsData are drawn client-side.
 
-@app.post("/calculate")
-def calculate(req: ProcessRequest) -> Any:
+    Pass ``?plot=svg`` (preferred) or ``?plot=png`` to also receive
+    server-rendered ``pv_plot``/``ts_plot`` data URLs.
+    """
     try:
-        result = calculate_process(req.process_type, req.substance, req.input_data, mass=req.mass)
+        items = tuple(req.input_data.model_dump(exclude_none=True).items())
+        # Off the event loop: a cache miss may wait on JIT compilation
+        result = await run_in_threadpool(_cached_calculate, req.process_type, req.substance, items, req.mass)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    # Create PV plot
-    pv = result.get("pvData", [])
-    fig1 = plt.figure()
-    if pv:
-        V = [p["V"] for p in pv]
-        P = [p["P"] for p in pv]
-        plt.plot(V, P, marker=".")
-        plt.xlabel("V (m^3)")
-        plt.ylabel("P (kPa)")
-        plt.title("P-V diagram")
-    pv_img = _plot_to_base64(fig1)
-
-    # Create T-S plot
-    ts = result.get("tsData", [])
-    fig2 = plt.figure()
-    if ts:
-        T = [p["T"] for p in ts]
-        S = [p["S"] for p in ts]
-        plt.plot(S, T, marker=".")
-        plt.xlabel("S (kJ/K)")
-        plt.ylabel("T (K)")
-        plt.title("T-S diagram")
-    ts_img = _plot_to_base64(fig2)
-
-    return {"result": result, "pv_plot": pv_img, "ts_plot": ts_img}
+    if plot is not None:
+        return {"result": result, **(await _render_plots(result, plot))}
+    return {"result": result}
 
 
 @app.get("/substances")
@@ -95,4 +203,13 @@ def list_substances() -> Any:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("api:app", host="127.0.0.1", port=8000, log_level="info")
+    # loop/http default to "auto", which picks uvloop and httptools when
+    # uvicorn[standard] installed them for this platform.
+    uvicorn.run(
+        "api:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=os.cpu_count(),
+        log_level="info",
+        access_log=False,
+    )
@@ -199,7 +199,11 @@ document.addEventListener("DOMContentLoaded", () => {
     .then(async res => {
       if (!res.ok) {
         const err = await res.json().catch(()=>({detail: 'unknown error'}));
-        throw new Error(err.detail || 'Request failed');
+        // 422 validation errors carry a list of {loc, msg} entries
+        const detail = Array.isArray(err.detail)
+          ? err.detail.map(d => `${d.loc[d.loc.length - 1]}: ${d.msg}`).join('; ')
+          : err.detail;
+        throw new Error(detail || 'Request failed');
       }
       return res.json();
     })
@@ -225,12 +229,13 @@ document.addEventListener("DOMContentLoaded", () => {
       `).join('');
       
       // Use pvData and tsData for interactive plots if available
-      const pvDataArr = (data.result && data.result.pvData) || [];
-      const tsDataArr = (data.result && data.result.tsData) || [];
+      // pvData/tsData are columnar: {V: [...], P: [...]} and {S: [...], T: [...]}
+      const pvData = (data.result && data.result.pvData) || {};
+      const tsData = (data.result && data.result.tsData) || {};
 
-      if (pvDataArr.length > 0) {
-        const x = pvDataArr.map(p => p.V);
-        const y = pvDataArr.map(p => p.P);
+      if (pvData.V && pvData.V.length > 0) {
+        const x = pvData.V;
+        const y = pvData.P;
         const trace = { x, y, mode: 'lines+markers', name: 'P-V', line: {shape: 'spline'} };
         const layout = { xaxis: { title: 'V (m^3)' }, yaxis: { title: 'P (kPa)' }, margin: {t:30} };
         Plotly.newPlot(pvDiv, [trace], layout, {responsive: true});
@@ -247,9 +252,9 @@ document.addEventListener("DOMContentLoaded", () => {
         pvDownload.style.display = 'inline-block'; pvDownload.href = data.pv_plot; pvDownload.download = `pv_plot_${Date.now()}.png`;
       }
 
-      if (tsDataArr.length > 0) {
-        const x = tsDataArr.map(p => p.S);
-        const y = tsDataArr.map(p => p.T);
+      if (tsData.S && tsData.S.length > 0) {
+        const x = tsData.S;
+        const y = tsData.T;
         const trace = { x, y, mode: 'lines+markers', name: 'T-S', line: {shape: 'spline'} };
         const layout = { xaxis: { title: 'S (kJ/K)' }, yaxis: { title: 'T (K)' }, margin: {t:30} };
         Plotly.newPlot(tsDiv, [trace], layout, {responsive: true});